@@ -8,7 +8,8 @@ from tools import (
     analyze_keyword_density, 
     check_broken_links, 
     get_page_links_by_category,
-    crawl_sitemap_pages
+    crawl_sitemap_pages,
+    run_tools_concurrently
 )
 
 # 1. Define Agent State
@@ -33,8 +34,12 @@ def node_technical_audit(state: AgentState):
     existing_data = state["audit_data"]
     
     try:
-        # Run tools
-        meta = extract_meta_tags(url)
+        # Run tools (both only wait on the network, so fetch them side by side)
+        results = run_tools_concurrently({
+            "meta": (extract_meta_tags, (url,)),
+            "broken_links": (check_broken_links, (url, 5))
+        })
+        meta = results["meta"]
         
         # Check if tools returned errors
         if isinstance(meta, dict) and "error" in meta:
@@ -46,7 +51,7 @@ def node_technical_audit(state: AgentState):
             error_msg = f"Technical audit failed: {meta.get('error')}"
             return {"audit_data": existing_data, "errors": [error_msg]}
         
-        broken_links = check_broken_links(url, limit=5)
+        broken_links = results["broken_links"]
         
         existing_data["technical"] = {
             "meta_tags": meta,
@@ -79,10 +79,8 @@ STOPWORDS = {
     ]
 }
 
-# Flattened set for quick lookup
-STOPWORDS_SET = set()
-for category in STOPWORDS.values():
-    STOPWORDS_SET.update(category)
+# Flattened, lowercased set for quick lookup (frozen: it is shared, read-only data)
+STOPWORDS_SET = frozenset(word.lower() for category in STOPWORDS.values() for word in category)
 
 # ============================================================================
 # DOMAIN GENERATION CONFIGURATION
@@ -118,6 +116,18 @@ DOMAIN_PATTERNS = [
     'single'         # single noun
 ]
 
+# Name template for each domain pattern
+DOMAIN_PATTERN_FORMATS = {
+    'simple': '{adjective}{noun}',
+    'hyphenated': '{adjective}-{noun}',
+    'compound': '{noun}{second_noun}',
+    'numbered': '{adjective}{noun}{number}',
+    'single': '{noun}'
+}
+
+# Seeded domain names remembered by generate_realistic_domain(seed=...)
+SEEDED_DOMAIN_CACHE_SIZE = 4096
+
 # ============================================================================
 # LINK ANALYSIS CONFIGURATION
 # ============================================================================
@@ -140,6 +150,14 @@ GENERIC_ANCHORS = [
     "more info", "learn more", "continue reading", "view more"
 ]
 
+# Anchor phrases counted as generic in backlink anchor text analysis
+ANCHOR_ANALYSIS_GENERIC = frozenset({
+    "click here", "read more", "check this out", "learn more"
+})
+
+# Anchor phrases never counted as keyword anchors in backlink anchor text analysis
+ANCHOR_ANALYSIS_NON_KEYWORD = frozenset({"click here", "read more"})
+
 # High-quality anchor text examples for reference
 QUALITY_ANCHOR_KEYWORDS = [
     "best seo tools", "digital marketing", "seo guide", "industry leader",
@@ -169,6 +187,9 @@ SPEED_WARNING_THRESHOLD = 2000  # > 2000ms = Needs Improvement
 # Page size threshold (in KB)
 PAGE_SIZE_WARNING = 2000  # > 2000KB = Large page
 
+# Stop downloading a page for size measurement past this many bytes (5MB)
+PAGE_SIZE_READ_CAP = 5 * 1024 * 1024
+
 # ============================================================================
 # LINK VELOCITY CONFIGURATION
 # ============================================================================
@@ -213,6 +234,17 @@ LINK_TYPE_DISTRIBUTION = {
     'blog_links': 0.05
 }
 
+# Options drawn from when simulating each authority tier's links
+HIGH_AUTHORITY_PAGE_TYPES = ("homepage", "resource", "article")
+MEDIUM_AUTHORITY_ANCHORS = tuple(QUALITY_ANCHOR_KEYWORDS[:8])
+MEDIUM_AUTHORITY_LINK_TYPES = ("dofollow", "nofollow")
+MEDIUM_AUTHORITY_PAGE_TYPES = ("article", "directory", "resource")
+LOW_AUTHORITY_LINK_TYPES = ("dofollow", "nofollow", "sponsored")
+LOW_AUTHORITY_PAGE_TYPES = ("blog", "forum", "comment")
+
+# Page types frequently used for spam links
+RISKY_PAGE_TYPES = frozenset({"comment", "forum", "blog_spam"})
+
 # Toxicity score thresholds
 TOXICITY_HIGH = 70
 TOXICITY_MEDIUM = 40
@@ -247,6 +279,48 @@ HEAD_REQUEST_TIMEOUT = 5
 # Maximum links to check in broken link checker
 BROKEN_LINK_CHECKER_LIMIT = 10
 
+# Connection pooling for the shared HTTP session
+HTTP_POOL_CONNECTIONS = 20    # distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = 50        # keep-alive connections kept per host
+
+# Retries for idempotent requests (GET/HEAD) that fail to connect or hit a transient error status.
+# Read timeouts are never retried, so a slow server costs one timeout, not several.
+HTTP_MAX_RETRIES = 2
+HTTP_CONNECT_RETRIES = 1      # at most one extra connect attempt (each can take the full timeout)
+HTTP_RETRY_BACKOFF = 0.3      # seconds, doubled on each further retry
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Largest (decompressed) HTML body the page tools will download and parse
+MAX_HTML_BYTES = 10 * 1024 * 1024
+# Content-Type prefixes the page tools will download; anything else (PDFs, images,
+# video, CSS, plain text) is refused from the response headers before its body is read
+PAGE_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Fetched pages are reused by other tools auditing the same URL for this long
+PAGE_CACHE_TTL = 300          # seconds
+PAGE_CACHE_MAX_ENTRIES = 256  # pages kept before least recently used are evicted
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # total page bodies kept, whatever the entry count
+# Parsed trees are several times the size of their HTML, so far fewer are kept
+PAGE_TREE_CACHE_MAX_ENTRIES = 16
+PAGE_TREE_CACHE_MAX_BYTES = 8 * 1024 * 1024  # measured as the HTML the kept trees were parsed from
+
+# Finished meta/speed/keyword results for a URL are returned again for this long
+RESULT_CACHE_TTL = 300          # seconds
+RESULT_CACHE_MAX_ENTRIES = 1024 # results kept per tool
+
+# Parsed/joined URLs remembered by urlparse/urljoin in tools.py
+URL_PARSE_CACHE_SIZE = 4096
+
+# Resolved host addresses are reused for this long
+DNS_CACHE_TTL = 300           # seconds
+DNS_CACHE_MAX_ENTRIES = 512   # (host, port, ...) lookups kept
+
+# Maximum concurrent HEAD requests in broken link checker
+BROKEN_LINK_CHECKER_WORKERS = 10
+
+# Maximum tool calls run side by side by run_tools_concurrently
+TOOL_CONCURRENCY_WORKERS = 6
+
 # Maximum external domains to return in backlink extraction
 MAX_EXTERNAL_DOMAINS = 10
 
@@ -254,6 +328,16 @@ MAX_EXTERNAL_DOMAINS = 10
 # COMPETITOR ANALYSIS CONFIGURATION
 # ============================================================================
 
+# Search results for a keyword are reused for this long
+SERP_CACHE_TTL = 600          # seconds
+SERP_CACHE_MAX_ENTRIES = 128  # keywords kept before least recently used are evicted
+
+# Searches sent to DuckDuckGo are paced by a token bucket shared across threads
+SERP_RATE_LIMIT = 1.0         # searches per second, sustained
+SERP_RATE_BURST = 3           # searches allowed back to back before pacing starts
+SERP_BATCH_WORKERS = 3        # searches a batch lookup runs at once, on its own pool
+SERP_BATCH_MAX_KEYWORDS = 20  # keywords accepted by one /tools/serp-batch request
+
 # Number of competitors to analyze
 COMPETITORS_TO_ANALYZE = 3
 
@@ -334,5 +418,13 @@ LINK_CATEGORIES = {
 # Sitemap processing configuration
 SITEMAP_MAX_URLS = 1000  # Maximum URLs to process from sitemap
 SITEMAP_TIMEOUT = 30      # Timeout for sitemap fetching
+SITEMAP_FETCH_WORKERS = 4 # Child sitemaps of an index fetched at the same time
+SITEMAP_MAX_DEPTH = 3     # Levels of nested sitemap indexes followed
 MAX_PAGES_TO_CRAWL = 50   # Maximum pages to crawl from sitemap
 CRAWL_TIMEOUT = 10        # Timeout per page crawl
+CRAWL_WORKERS = 4         # Pages fetched at the same time while crawling
+CRAWL_HOST_RATE = 2.0     # Crawl requests per second sent to any one host (one every 0.5s)
+CRAWL_HOST_BURST = 1      # Requests a host may receive back to back before pacing kicks in
+CRAWL_HOST_LIMITERS_MAX = 256  # Hosts whose pacing state is remembered
+CRAWL_HOST_LIMITER_TTL = 60    # Seconds an idle host's pacing state is kept
+CATEGORIZE_LINK_CACHE_SIZE = 8192 # (href, anchor, domain) categorizations remembered
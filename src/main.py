@@ -4,7 +4,7 @@ import time
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 # Add src directory to Python path
@@ -16,9 +16,12 @@ from tools import (
     check_broken_links, 
     get_page_links_by_category,
     crawl_sitemap_pages,
-    parse_sitemap
+    parse_sitemap,
+    get_competitor_rankings_batch,
+    audit_page
 )
 from agent import seo_agent_app, link_categorization_agent_app
+from data_config import SERP_BATCH_MAX_KEYWORDS
 
 app = FastAPI(title="SEO Agent API", version="1.0")
 
@@ -48,6 +51,9 @@ class UrlRequest(BaseModel):
 class KeywordRequest(BaseModel):
     keyword: str
 
+class KeywordListRequest(BaseModel):
+    keywords: List[str] = Field(..., max_length=SERP_BATCH_MAX_KEYWORDS)
+
 class AuditRequest(BaseModel):
     url: str
     focus_areas: Optional[List[str]] = ["all"]
@@ -81,10 +87,20 @@ def tool_broken_links(request: UrlRequest):
 def tool_serp_check(request: KeywordRequest):
     return tools.get_competitor_rankings(request.keyword)
 
+@app.post("/tools/serp-batch")
+def tool_serp_batch_check(request: KeywordListRequest):
+    """Look up competitor rankings for several keywords concurrently"""
+    return {"results": get_competitor_rankings_batch(request.keywords)}
+
 @app.post("/tools/keywords")
 def tool_keyword_density(request: UrlRequest):
     return tools.analyze_keyword_density(url=request.url)
 
+@app.post("/tools/audit")
+def tool_page_audit(request: UrlRequest):
+    """Run the meta, speed, broken link and keyword tools on one page in a single pass"""
+    return audit_page(request.url)
+
 @app.post("/tools/links-by-category")
 def tool_categorized_links(request: UrlRequest):
     """Extract all links from a page and categorize them"""
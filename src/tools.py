@@ -1,20 +1,35 @@
 import requests
-from bs4 import BeautifulSoup
-from collections import Counter
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from lxml import etree
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+import copy
+import functools
+import gzip
+import hashlib
+import os
 import re
+import socket
+import threading
 import time
-from duckduckgo_search import DDGS
 import random
 from urllib.parse import urlparse, urljoin
-import xml.etree.ElementTree as ET
 from data_config import (
     STOPWORDS_SET,
     DOMAIN_ADJECTIVES,
     DOMAIN_NOUNS,
     DOMAIN_TLDS,
+    DOMAIN_PATTERNS,
+    DOMAIN_PATTERN_FORMATS,
+    SEEDED_DOMAIN_CACHE_SIZE,
     SPAM_INDICATORS,
     SUSPICIOUS_TLDS,
     GENERIC_ANCHORS,
+    ANCHOR_ANALYSIS_GENERIC,
+    ANCHOR_ANALYSIS_NON_KEYWORD,
     QUALITY_ANCHOR_KEYWORDS,
     MIN_KEYWORD_LENGTH,
     TOP_KEYWORDS_COUNT,
@@ -40,112 +55,536 @@ from data_config import (
     HEAD_REQUEST_TIMEOUT,
     MAX_EXTERNAL_DOMAINS,
     LINK_TYPE_DISTRIBUTION,
+    HIGH_AUTHORITY_PAGE_TYPES,
+    MEDIUM_AUTHORITY_ANCHORS,
+    MEDIUM_AUTHORITY_LINK_TYPES,
+    MEDIUM_AUTHORITY_PAGE_TYPES,
+    LOW_AUTHORITY_LINK_TYPES,
+    LOW_AUTHORITY_PAGE_TYPES,
+    RISKY_PAGE_TYPES,
+    COMPETITORS_TO_ANALYZE,
+    COMPETITOR_CONFIDENCE_HIGH,
+    COMPETITOR_CONFIDENCE_MEDIUM,
+    COMPETITOR_CONFIDENCE_LOW,
+    AUTHORITY_GAP_HIGH_IMPACT,
+    AUTHORITY_GAP_MEDIUM_IMPACT,
+    DOMAIN_DIVERSITY_HIGH_IMPACT,
+    DOMAIN_DIVERSITY_MEDIUM_IMPACT,
+    DOFOLLOW_QUALITY_GAP_IMPACT,
     LINK_CATEGORIES,
     SITEMAP_MAX_URLS,
     SITEMAP_TIMEOUT,
+    SITEMAP_FETCH_WORKERS,
+    SITEMAP_MAX_DEPTH,
     MAX_PAGES_TO_CRAWL,
-    CRAWL_TIMEOUT
+    CRAWL_TIMEOUT,
+    CRAWL_WORKERS,
+    CRAWL_HOST_RATE,
+    CRAWL_HOST_BURST,
+    CRAWL_HOST_LIMITERS_MAX,
+    CRAWL_HOST_LIMITER_TTL,
+    CATEGORIZE_LINK_CACHE_SIZE,
+    TOOL_CONCURRENCY_WORKERS,
+    MAX_HTML_BYTES,
+    PAGE_CONTENT_TYPES,
+    PAGE_CACHE_TTL,
+    PAGE_CACHE_MAX_ENTRIES,
+    PAGE_CACHE_MAX_BYTES,
+    PAGE_TREE_CACHE_MAX_ENTRIES,
+    PAGE_TREE_CACHE_MAX_BYTES,
+    RESULT_CACHE_TTL,
+    RESULT_CACHE_MAX_ENTRIES,
+    SERP_CACHE_TTL,
+    SERP_CACHE_MAX_ENTRIES,
+    SERP_RATE_LIMIT,
+    SERP_RATE_BURST,
+    SERP_BATCH_WORKERS,
+    URL_PARSE_CACHE_SIZE,
+    DNS_CACHE_TTL,
+    DNS_CACHE_MAX_ENTRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_CONNECT_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_STATUSES,
+    BROKEN_LINK_CHECKER_LIMIT,
+    SPEED_GOOD_THRESHOLD,
+    SPEED_WARNING_THRESHOLD,
+    PAGE_SIZE_WARNING,
+    PAGE_SIZE_READ_CAP,
+    BROKEN_LINK_CHECKER_WORKERS
 )
 
+# Browser-like headers for page scrapers. Accept-Encoding is requests' own default,
+# which adds br (and zstd) whenever a decoder for it is installed.
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Word tokenizer for keyword analysis, compiled once at import. It only matches
+# words of at least MIN_KEYWORD_LENGTH characters, so short tokens are dropped
+# inside the regex engine instead of being counted and filtered in Python.
+# The ASCII variant matches the same words on pure-ASCII text but skips Unicode
+# character-class lookups, which makes large English pages tokenize faster.
+WORD_PATTERN = re.compile(rf'\w{{{MIN_KEYWORD_LENGTH},}}')
+ASCII_WORD_PATTERN = re.compile(rf'\w{{{MIN_KEYWORD_LENGTH},}}', re.ASCII)
+
+# Tags read by extract_meta_tags in its single walk over the page tree
+META_TAGS = ('title', 'meta', 'h1', 'h2', 'img')
+
+# Text nodes a reader would see: everything outside script/style/noscript/svg
+# (comments are never text nodes). smart_strings=False returns plain str results.
+VISIBLE_TEXT_XPATH = etree.XPath(
+    '//text()[not(ancestor::script or ancestor::style or ancestor::noscript or ancestor::svg)]',
+    smart_strings=False
+)
+
+
+# ============================================================================
+# SHARED FETCHING & CONCURRENCY HELPERS
+# ============================================================================
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after ttl seconds.
+    With max_bytes set, entries are also evicted once the sizes reported by
+    sizeof(value) add up to more than max_bytes; a value larger than that
+    on its own is not stored at all.
+    """
+    def __init__(self, maxsize: int, ttl: float, max_bytes: int = None, sizeof=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._bytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at, size = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._bytes -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            self._data[key] = (value, time.monotonic() + self.ttl, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._bytes -= self._data.popitem(last=False)[1][2]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter. acquire() allows `rate` calls per
+    second on average, with bursts of up to `capacity` calls. Callers over the
+    limit reserve a slot and sleep outside the lock, so they don't block each other.
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# urlparse and urljoin are pure, and a crawl parses the same page URLs and nav
+# links over and over, so remember recent results (the tuples are immutable)
+urlparse = functools.lru_cache(maxsize=URL_PARSE_CACHE_SIZE)(urlparse)
+urljoin = functools.lru_cache(maxsize=URL_PARSE_CACHE_SIZE)(urljoin)
+
+
+def url_netloc(href: str) -> str:
+    """
+    Returns the netloc of an absolute URL by slicing, without building a ParseResult.
+    Matches urlparse(href).netloc for scheme://host hrefs; anything else gives ''.
+    """
+    scheme, sep, rest = href.partition('://')
+    if not sep or not scheme or '/' in scheme:
+        return ''
+    end = len(rest)
+    for delimiter in '/?#':
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    return rest[:end]
+
+
+# Recent DNS answers, so repeat fetches from the same hosts skip the resolver
+DNS_CACHE = TTLCache(maxsize=DNS_CACHE_MAX_ENTRIES, ttl=DNS_CACHE_TTL)
+# Unwrap first so re-importing this module never stacks two caches
+_system_getaddrinfo = getattr(socket.getaddrinfo, '__wrapped__', socket.getaddrinfo)
+
+
+@functools.wraps(_system_getaddrinfo)
+def cached_getaddrinfo(*args, **kwargs):
+    """
+    socket.getaddrinfo with a TTL cache in front. Failed lookups are not cached.
+    """
+    key = (args, tuple(sorted(kwargs.items())))
+    addresses = DNS_CACHE.get(key)
+    if addresses is None:
+        addresses = _system_getaddrinfo(*args, **kwargs)
+        DNS_CACHE.set(key, addresses)
+    return addresses
+
+
+socket.getaddrinfo = cached_getaddrinfo
+
+# One HTTP session for the tools, so repeat requests to a host reuse
+# keep-alive connections instead of paying a new TCP/TLS handshake
+# Failed connects and transient error statuses are retried with backoff. Read
+# timeouts are not: a server that is merely slow would otherwise hold a tool for
+# several timeouts. The final response is still returned (not raised) so callers
+# keep seeing real status codes, and Retry-After is not honoured because a server
+# could otherwise stall a tool for minutes.
+HTTP_RETRY = Retry(
+    total=HTTP_MAX_RETRIES,
+    connect=HTTP_CONNECT_RETRIES,
+    read=False,
+    other=0,
+    backoff_factor=HTTP_RETRY_BACKOFF,
+    status_forcelist=HTTP_RETRY_STATUSES,
+    raise_on_status=False,
+    respect_retry_after_header=False
+)
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+SESSION.mount('http://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY))
+SESSION.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY))
+
+# Session without retries for tools that report on the first response itself:
+# the broken-link probe and the page speed timing
+PROBE_SESSION = requests.Session()
+PROBE_SESSION.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+PROBE_SESSION.mount('http://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0))
+PROBE_SESSION.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0))
+
+# Recently fetched pages, shared by every tool that parses a page's HTML. Bounded
+# by total body size too, since a crawl can push hundreds of large pages through it.
+PAGE_CACHE = TTLCache(
+    maxsize=PAGE_CACHE_MAX_ENTRIES,
+    ttl=PAGE_CACHE_TTL,
+    max_bytes=PAGE_CACHE_MAX_BYTES,
+    sizeof=lambda response: len(response.content)
+)
+# Per-URL locks for fetches in flight, so tools running side by side on the
+# same page wait for one download instead of each starting their own
+PAGE_FETCH_LOCKS = {}
+PAGE_FETCH_LOCKS_GUARD = threading.Lock()
+
+
+def read_capped_body(response):
+    """
+    Reads a streamed response into response.content, refusing bodies over
+    MAX_HTML_BYTES so one huge page can't exhaust memory or stall the parser.
+    """
+    too_large = f"Page is larger than the {MAX_HTML_BYTES / (1024 * 1024):g} MB limit"
+    content_length = response.headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > MAX_HTML_BYTES:
+        response.close()
+        raise ValueError(too_large)
+    
+    # Counted after decompression, so a small compressed bomb is caught too
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) > MAX_HTML_BYTES:
+            response.close()
+            raise ValueError(too_large)
+    response._content = bytes(body)
+
+
+def fetch_page(url: str, headers: dict):
+    """
+    GETs a page, reusing a recent successful response for the same URL
+    so an audit running several tools downloads the page only once.
+    """
+    response = PAGE_CACHE.get(url)
+    if response is not None:
+        return response
+
+    with PAGE_FETCH_LOCKS_GUARD:
+        url_lock = PAGE_FETCH_LOCKS.setdefault(url, threading.Lock())
+    try:
+        with url_lock:
+            # Another caller may have finished the download while we waited
+            response = PAGE_CACHE.get(url)
+            if response is None:
+                response = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)
+                # The body hasn't been read yet, so a sitemap entry pointing at a PDF
+                # or video costs only its headers (error pages are still read below)
+                content_type = response.headers.get('Content-Type', '')
+                if response.ok and content_type and not content_type.lower().startswith(PAGE_CONTENT_TYPES):
+                    response.close()
+                    raise ValueError(f"Not an HTML page (Content-Type: {content_type})")
+                read_capped_body(response)
+                if response.ok:
+                    PAGE_CACHE.set(url, response)
+    finally:
+        with PAGE_FETCH_LOCKS_GUARD:
+            if PAGE_FETCH_LOCKS.get(url) is url_lock:
+                del PAGE_FETCH_LOCKS[url]
+    return response
+
+
+# Parsed trees of pages held in PAGE_CACHE, keyed by URL as (response, root), so
+# the tools in one audit parse a page only once. Kept much smaller than PAGE_CACHE.
+PAGE_TREE_CACHE = TTLCache(
+    maxsize=PAGE_TREE_CACHE_MAX_ENTRIES,
+    ttl=PAGE_CACHE_TTL,
+    max_bytes=PAGE_TREE_CACHE_MAX_BYTES,
+    sizeof=lambda entry: len(entry[0].content)
+)
+
+
+def parse_page(url: str, response):
+    """
+    Returns the lxml root of a page fetched by fetch_page(url, ...) (None for an
+    empty body). Trees of responses PAGE_CACHE kept are reused, so each is parsed
+    once. The tree may be shared, so callers must not modify it.
+    """
+    entry = PAGE_TREE_CACHE.get(url)
+    if entry is not None and entry[0] is response:
+        return entry[1]
+
+    # Trust a charset the server declared so the parser can skip sniffing for one
+    parser = None
+    if 'charset=' in response.headers.get('content-type', '').lower():
+        try:
+            parser = etree.HTMLParser(encoding=response.encoding)
+        except LookupError:
+            pass  # charset libxml2 doesn't know; let it sniff instead
+    root = etree.HTML(response.content, parser)
+    # Error pages and responses too big for PAGE_CACHE won't be handed out again
+    if root is not None and PAGE_CACHE.get(url) is response:
+        PAGE_TREE_CACHE.set(url, (response, root))
+    return root
+
+
+def cache_results(func):
+    """
+    Decorator that returns a tool's recent result again for the same arguments.
+    Error results are not cached, so a failed fetch is retried on the next call.
+    Callers get a copy, so editing a returned report never alters the cache.
+    """
+    cache = TTLCache(maxsize=RESULT_CACHE_MAX_ENTRIES, ttl=RESULT_CACHE_TTL)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        result = cache.get(key)
+        if result is None:
+            result = func(*args, **kwargs)
+            if not (isinstance(result, dict) and "error" in result):
+                cache.set(key, result)
+        return copy.deepcopy(result)
+
+    wrapper.cache = cache
+    return wrapper
+
+
+# Shared worker pool for running independent network-bound tools side by side
+TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=TOOL_CONCURRENCY_WORKERS)
+
+
+def run_tools_concurrently(calls: dict):
+    """
+    Runs independent tool calls at the same time on the shared worker pool.
+    Takes {name: (tool_function, args)} and returns {name: result}.
+    """
+    futures = {name: TOOL_EXECUTOR.submit(func, *args) for name, (func, args) in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 # --- Realistic Domain Name Generation ---
-def generate_realistic_domain():
+# Name templates in DOMAIN_PATTERNS order, built once instead of per domain
+DOMAIN_NAME_FORMATS = tuple(DOMAIN_PATTERN_FORMATS[pattern] for pattern in DOMAIN_PATTERNS)
+
+
+def draw_realistic_domain(rng):
+    """
+    Draws one domain name using rng (the random module or a random.Random).
+    """
+    pattern = rng.choice(DOMAIN_NAME_FORMATS)
+    name = pattern.format(
+        adjective=rng.choice(DOMAIN_ADJECTIVES),
+        noun=rng.choice(DOMAIN_NOUNS),
+        second_noun=rng.choice(DOMAIN_NOUNS),
+        number=rng.randint(1, 999)
+    )
+    return f"{name}.{rng.choice(DOMAIN_TLDS)}".lower()
+
+
+@functools.lru_cache(maxsize=SEEDED_DOMAIN_CACHE_SIZE)
+def seeded_realistic_domain(seed):
+    """
+    The domain name for a seed. Seeded draws are deterministic, so they are memoized.
+    """
+    return draw_realistic_domain(random.Random(seed))
+
+
+def generate_realistic_domain(seed=None):
     """
     Generates realistic, plausible domain names that look like real websites.
     Uses DOMAIN_ADJECTIVES, DOMAIN_NOUNS, and DOMAIN_TLDS from data_config.py
+    Pass a seed (int or str, e.g. f"{site}:{n}") to get the same name on every call;
+    use generate_realistic_websites for unseeded batches.
     """
-    # Generate domain - use various patterns from config
-    pattern = random.choice([
-        # Simple adjective + noun
-        lambda: f"{random.choice(DOMAIN_ADJECTIVES)}{random.choice(DOMAIN_NOUNS)}",
-        # Adjective-noun hyphenated
-        lambda: f"{random.choice(DOMAIN_ADJECTIVES)}-{random.choice(DOMAIN_NOUNS)}",
-        # Double word
-        lambda: f"{random.choice(DOMAIN_NOUNS)}{random.choice(DOMAIN_NOUNS)}",
-        # Number inclusion (looks real)
-        lambda: f"{random.choice(DOMAIN_ADJECTIVES)}{random.choice(DOMAIN_NOUNS)}{random.randint(1, 999)}",
-        # Single word variations
-        lambda: random.choice(DOMAIN_NOUNS),
-    ])
-    
-    domain_name = pattern()
-    tld = random.choice(DOMAIN_TLDS)
-    return f"{domain_name}.{tld}".lower()
+    if seed is not None:
+        return seeded_realistic_domain(seed)
+    return draw_realistic_domain(random)
 
 
 # ============================================================================
 # SITEMAP & LINK TRAVERSAL FUNCTIONS
 # ============================================================================
 
-def parse_sitemap(sitemap_url: str):
+# Sitemap tags, namespaced as in the sitemaps.org protocol
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+SITEMAP_URL_TAG = SITEMAP_NS + 'url'
+SITEMAP_SITEMAP_TAG = SITEMAP_NS + 'sitemap'
+SITEMAP_LOC_TAG = SITEMAP_NS + 'loc'
+# The only elements read_sitemap_locs needs to hear about
+SITEMAP_ENTRY_TAGS = (SITEMAP_URL_TAG, SITEMAP_SITEMAP_TAG, 'url', 'loc')
+
+
+def read_sitemap_locs(stream):
+    """
+    Stream-parses sitemap XML, keeping only <loc> values rather than the whole tree.
+    Returns (sitemap_locs, page_locs, plain_url_locs, plain_locs): nested sitemaps
+    and pages from namespaced sitemaps, plus <url><loc> and bare <loc> values from
+    sitemaps without the namespace. Stops reading once SITEMAP_MAX_URLS pages are found.
+    """
+    sitemap_locs, page_locs, plain_url_locs, plain_locs = [], [], [], []
+    # libxml2 filters by tag, so <lastmod>, <changefreq> etc. never reach Python
+    for _, elem in etree.iterparse(stream, events=('end',), tag=SITEMAP_ENTRY_TAGS):
+        tag = elem.tag
+        if tag == SITEMAP_URL_TAG or tag == SITEMAP_SITEMAP_TAG:
+            loc = elem.find(SITEMAP_LOC_TAG)
+            if loc is not None and loc.text:
+                (page_locs if tag == SITEMAP_URL_TAG else sitemap_locs).append(loc.text)
+        elif tag == 'loc':
+            if elem.text and len(plain_locs) < SITEMAP_MAX_URLS:
+                plain_locs.append(elem.text)
+            continue
+        elif tag == 'url':
+            loc = elem.find('loc')
+            if loc is not None and loc.text and len(plain_url_locs) < SITEMAP_MAX_URLS:
+                plain_url_locs.append(loc.text)
+        else:
+            continue
+        
+        # Entry read: free it and the entries before it so memory stays flat
+        elem.clear()
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+        if len(page_locs) >= SITEMAP_MAX_URLS:
+            break
+    
+    return sitemap_locs, page_locs, plain_url_locs, plain_locs
+
+
+def parse_sitemap(sitemap_url: str, depth: int = 0):
     """
     Parses XML sitemap and extracts all URLs.
-    Supports standard XML sitemaps and sitemap indexes.
+    Supports standard XML sitemaps and sitemap indexes (followed up to
+    SITEMAP_MAX_DEPTH levels deep, fetching each index's children concurrently).
     Returns: dict with urls list or error message
     """
     try:
         headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(sitemap_url, headers=headers, timeout=SITEMAP_TIMEOUT)
-        response.raise_for_status()
-        
-        # Check if response is XML
-        content_type = response.headers.get('content-type', '').lower()
-        if 'html' in content_type:
-            return {
-                "error": "Invalid sitemap format",
-                "message": "The URL returned HTML instead of XML. Please verify the sitemap URL.",
-                "urls": []
-            }
-        
-        # Parse XML
-        try:
-            root = ET.fromstring(response.content)
-        except ET.ParseError as e:
-            return {
-                "error": "XML parsing failed",
-                "message": f"Invalid XML format: {str(e)}. Please ensure the URL points to a valid sitemap.xml file.",
-                "urls": []
-            }
-        
-        # Define namespace (sitemaps use XML namespaces)
-        namespace = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+        # Streamed, so a large sitemap is parsed as it downloads and reading
+        # stops at SITEMAP_MAX_URLS instead of holding the whole file
+        with SESSION.get(sitemap_url, headers=headers, timeout=SITEMAP_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            
+            # Check if response is XML
+            content_type = response.headers.get('content-type', '').lower()
+            if 'html' in content_type:
+                return {
+                    "error": "Invalid sitemap format",
+                    "message": "The URL returned HTML instead of XML. Please verify the sitemap URL.",
+                    "urls": []
+                }
+            
+            # Parse XML (undoing any gzip/deflate transfer encoding as it streams)
+            response.raw.decode_content = True
+            stream = response.raw
+            is_gzip_file = urlparse(sitemap_url).path.endswith('.gz') or 'gzip' in content_type
+            if is_gzip_file and 'gzip' not in response.headers.get('content-encoding', ''):
+                # Compressed sitemap file (sitemap.xml.gz), not just compressed transfer
+                stream = gzip.GzipFile(fileobj=response.raw)
+            try:
+                sitemap_locs, page_locs, plain_url_locs, plain_locs = read_sitemap_locs(stream)
+            except (etree.XMLSyntaxError, gzip.BadGzipFile) as e:
+                return {
+                    "error": "XML parsing failed",
+                    "message": f"Invalid XML format: {str(e)}. Please ensure the URL points to a valid sitemap.xml file.",
+                    "urls": []
+                }
         
         urls = []
         
         # Check if this is a sitemap index (contains other sitemaps)
-        sitemap_entries = root.findall('ns:sitemap', namespace)
-        if sitemap_entries:
-            # This is a sitemap index - recursively parse each sitemap
-            for sitemap in sitemap_entries:
-                sitemap_loc = sitemap.find('ns:loc', namespace)
-                if sitemap_loc is not None and sitemap_loc.text:
-                    try:
-                        nested_result = parse_sitemap(sitemap_loc.text)
-                        if isinstance(nested_result, dict) and "urls" in nested_result:
-                            urls.extend(nested_result["urls"])
-                        elif isinstance(nested_result, list):
-                            urls.extend(nested_result)
-                        if len(urls) >= SITEMAP_MAX_URLS:
-                            break
-                    except:
-                        pass
+        if sitemap_locs:
+            # This is a sitemap index - recursively parse each sitemap. Each index
+            # gets its own small pool (a shared one could deadlock on nested indexes),
+            # and results are merged in index order.
+            if depth < SITEMAP_MAX_DEPTH:
+                with ThreadPoolExecutor(max_workers=min(SITEMAP_FETCH_WORKERS, len(sitemap_locs))) as executor:
+                    futures = [executor.submit(parse_sitemap, sitemap_loc, depth + 1) for sitemap_loc in sitemap_locs]
+                    for future in futures:
+                        try:
+                            nested_result = future.result()
+                            if isinstance(nested_result, dict) and "urls" in nested_result:
+                                urls.extend(nested_result["urls"])
+                            elif isinstance(nested_result, list):
+                                urls.extend(nested_result)
+                            if len(urls) >= SITEMAP_MAX_URLS:
+                                break
+                        except:
+                            pass
+                    # Enough URLs: don't start the child sitemaps still queued
+                    for future in futures:
+                        future.cancel()
         else:
             # This is a regular sitemap with URL entries
-            url_entries = root.findall('ns:url', namespace)
-            for url_entry in url_entries:
-                loc = url_entry.find('ns:loc', namespace)
-                if loc is not None and loc.text:
-                    urls.append(loc.text)
-                if len(urls) >= SITEMAP_MAX_URLS:
-                    break
+            urls = page_locs
         
         # Also try without namespace for non-standard sitemaps
         if not urls:
-            url_entries = root.findall('.//url/loc') or root.findall('.//loc')
-            for loc in url_entries:
-                if loc.text:
-                    urls.append(loc.text)
-                if len(urls) >= SITEMAP_MAX_URLS:
-                    break
+            urls = plain_url_locs or plain_locs
         
         if not urls:
             return {
@@ -180,6 +619,17 @@ def parse_sitemap(sitemap_url: str):
         }
 
 
+# One compiled keyword alternation per internal category, in LINK_CATEGORIES order
+# (first matching category wins, as with the original nested keyword loops)
+CATEGORY_KEYWORD_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, config['keywords']))))
+    for category, config in LINK_CATEGORIES.items()
+    if category != 'external' and config['keywords']
+)
+
+
+# Nav menus and footers repeat the same links on every page, so remember answers
+@functools.lru_cache(maxsize=CATEGORIZE_LINK_CACHE_SIZE)
 def categorize_link(href: str, anchor_text: str, page_domain: str):
     """
     Categorizes a link based on its URL and anchor text.
@@ -188,21 +638,20 @@ def categorize_link(href: str, anchor_text: str, page_domain: str):
     href_lower = href.lower()
     anchor_lower = anchor_text.lower()
     
-    # Check if external link
-    link_domain = urlparse(href).netloc.replace('www.', '')
+    # Check if external link (only an href containing '//' can name a host,
+    # so relative links skip urlparse altogether)
+    link_domain = urlparse(href).netloc.replace('www.', '') if '//' in href else ''
     is_external = link_domain and link_domain != page_domain
     
     if is_external:
         return ('external', 1.0)
     
-    # Categorize internal links
-    for category, config in LINK_CATEGORIES.items():
-        if category == 'external':
-            continue
-        
-        for keyword in config['keywords']:
-            if keyword in href_lower or keyword in anchor_lower:
-                return (category, 0.9)
+    # Categorize internal links: search URL and anchor together in one C-level scan
+    # (the NUL separator keeps a keyword from matching across the two)
+    link_text = f"{href_lower}\0{anchor_lower}"
+    for category, keyword_pattern in CATEGORY_KEYWORD_PATTERNS:
+        if keyword_pattern.search(link_text):
+            return (category, 0.9)
     
     # Default to business category for internal links
     return ('business', 0.5)
@@ -214,15 +663,8 @@ def get_page_links_by_category(url: str):
     Returns: dictionary of links organized by category
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        headers = BROWSER_HEADERS
+        response = fetch_page(url, headers)
         
         if response.status_code == 403:
             return {
@@ -235,7 +677,8 @@ def get_page_links_by_category(url: str):
         
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # Shared parsed tree of the page (None for an empty body)
+        root = parse_page(url, response)
         page_domain = urlparse(url).netloc.replace('www.', '')
         
         # Initialize category structure
@@ -249,24 +692,22 @@ def get_page_links_by_category(url: str):
         }
         
         # Extract and categorize all links
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').strip()
-            anchor_text = link.get_text(strip=True)
+        for link in (root.iter('a') if root is not None else ()):
+            href = link.get('href')
+            if href is None:
+                continue
+            href = href.strip()
+            anchor_text = ''.join(text.strip() for text in link.itertext())
             
             # Skip empty hrefs and javascript
-            if not href or href.startswith('javascript:') or href.startswith('mailto:'):
+            if not href or href.startswith(('javascript:', 'mailto:')):
                 continue
             
             # Convert relative URLs to absolute
-            if href.startswith('/'):
-                absolute_url = urljoin(url, href)
-            elif not href.startswith('http'):
-                absolute_url = urljoin(url, href)
-            else:
-                absolute_url = href
+            absolute_url = href if href.startswith('http') else urljoin(url, href)
             
             # Get link attributes
-            rel = link.get('rel', [])
+            rel = link.get('rel', '').split()
             is_nofollow = 'nofollow' in rel
             is_sponsored = 'sponsored' in rel
             
@@ -314,6 +755,30 @@ def get_page_links_by_category(url: str):
         }
 
 
+# Worker pool for crawling sitemap pages; kept small so a crawl stays polite
+CRAWL_EXECUTOR = ThreadPoolExecutor(max_workers=CRAWL_WORKERS)
+# One rate limiter per host, so pages on different hosts are paced independently.
+# Bounded, and idle hosts expire, so a long-running server doesn't keep every host it ever crawled.
+CRAWL_HOST_LIMITERS = TTLCache(maxsize=CRAWL_HOST_LIMITERS_MAX, ttl=CRAWL_HOST_LIMITER_TTL)
+CRAWL_HOST_LIMITERS_GUARD = threading.Lock()
+
+
+def crawl_page(page_url: str):
+    """
+    Fetches and categorizes one crawled page once the page's host has a free
+    slot, keeping each server under CRAWL_HOST_RATE requests per second.
+    """
+    host = urlparse(page_url).netloc.lower()
+    with CRAWL_HOST_LIMITERS_GUARD:
+        limiter = CRAWL_HOST_LIMITERS.get(host)
+        if limiter is None:
+            limiter = TokenBucket(CRAWL_HOST_RATE, CRAWL_HOST_BURST)
+        # Re-set on every use so a host that is still being crawled never expires
+        CRAWL_HOST_LIMITERS.set(host, limiter)
+    limiter.acquire()
+    return get_page_links_by_category(page_url)
+
+
 def crawl_sitemap_pages(sitemap_url: str, max_pages: int = None):
     """
     Crawls pages from a sitemap and extracts links from each page.
@@ -324,12 +789,13 @@ def crawl_sitemap_pages(sitemap_url: str, max_pages: int = None):
     
     try:
         # Parse sitemap to get URLs
-        urls = parse_sitemap(sitemap_url)
+        sitemap_data = parse_sitemap(sitemap_url)
         
-        if isinstance(urls, dict) and 'error' in urls:
-            return urls
+        if 'error' in sitemap_data:
+            return sitemap_data
         
         # Limit number of pages to crawl
+        urls = sitemap_data['urls']
         urls_to_crawl = urls[:max_pages]
         
         # Crawl each page and extract links
@@ -343,9 +809,12 @@ def crawl_sitemap_pages(sitemap_url: str, max_pages: int = None):
             for category, config in LINK_CATEGORIES.items()
         }
         
-        for idx, page_url in enumerate(urls_to_crawl, 1):
+        # Fetch pages a few at a time, then collect them in sitemap order
+        futures = [CRAWL_EXECUTOR.submit(crawl_page, page_url) for page_url in urls_to_crawl]
+        
+        for idx, (page_url, future) in enumerate(zip(urls_to_crawl, futures), 1):
             try:
-                page_data = get_page_links_by_category(page_url)
+                page_data = future.result()
                 
                 if 'error' not in page_data:
                     all_pages_links.append({
@@ -360,9 +829,6 @@ def crawl_sitemap_pages(sitemap_url: str, max_pages: int = None):
                         if cat_data['count'] > 0:
                             category_summary[category]['total_count'] += cat_data['count']
                             category_summary[category]['pages_with_this_category'] += 1
-                
-                # Small delay to avoid overwhelming server
-                time.sleep(0.5)
             
             except Exception as e:
                 # Continue with next page on error
@@ -389,15 +855,37 @@ def crawl_sitemap_pages(sitemap_url: str, max_pages: int = None):
 
 
 
-def generate_realistic_websites(count: int, exclude_suspicious: bool = False):
+def generate_realistic_websites(count: int, exclude_suspicious: bool = False, rng=random):
     """
     Generates a list of realistic website domains.
     If exclude_suspicious=False, may include some suspicious TLDs for low-authority sites.
+    Each name part is drawn for the whole batch in one rng.choices call
+    (rng is the random module or a random.Random).
     """
-    return [generate_realistic_domain() for _ in range(count)]
+    patterns = rng.choices(DOMAIN_NAME_FORMATS, k=count)
+    adjectives = rng.choices(DOMAIN_ADJECTIVES, k=count)
+    nouns = rng.choices(DOMAIN_NOUNS, k=count)
+    second_nouns = rng.choices(DOMAIN_NOUNS, k=count)
+    numbers = rng.choices(range(1, 1000), k=count)
+    tlds = rng.choices(DOMAIN_TLDS, k=count)
+    
+    return [
+        f"{pattern.format(adjective=adjective, noun=noun, second_noun=second_noun, number=number)}.{tld}".lower()
+        for pattern, adjective, noun, second_noun, number, tld
+        in zip(patterns, adjectives, nouns, second_nouns, numbers, tlds)
+    ]
 
 
 # --- Toxic Link Detection Utility ---
+# Lookup-friendly forms of the indicator lists: endswith() takes a tuple in one
+# C call, and generic anchors are exact matches, so a frozenset suits them
+SUSPICIOUS_TLD_SUFFIXES = tuple(SUSPICIOUS_TLDS)
+GENERIC_ANCHORS_SET = frozenset(GENERIC_ANCHORS)
+# All spam indicators as one alternation, so each string is scanned once in C
+# rather than once per indicator from a Python generator
+SPAM_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, SPAM_INDICATORS)))
+
+
 def detect_toxic_characteristics(domain: str, anchor_text: str, page_type: str, domain_authority: int):
     """
     Analyzes a backlink for toxic/spammy characteristics using data_config thresholds.
@@ -416,31 +904,33 @@ def detect_toxic_characteristics(domain: str, anchor_text: str, page_type: str,
     
     # Check 2: Suspicious domain patterns
     domain_lower = domain.lower()
-    if any(indicator in domain_lower for indicator in SPAM_INDICATORS):
+    if SPAM_INDICATOR_PATTERN.search(domain_lower):
         toxicity_score += TOXICITY_WEIGHTS['suspicious_domain']
         reasons.append("Suspicious domain name pattern detected")
     
     # Check 3: Suspicious TLD patterns
-    if any(domain_lower.endswith(tld) for tld in SUSPICIOUS_TLDS):
+    if domain_lower.endswith(SUSPICIOUS_TLD_SUFFIXES):
         toxicity_score += TOXICITY_WEIGHTS['suspicious_tld']
         reasons.append("Suspicious TLD (.biz, .info, etc.)")
     
     # Check 4: Over-optimization of anchor text (keyword stuffing)
-    if anchor_text and len(anchor_text.split()) > 4:
+    anchor_lower = anchor_text.lower() if anchor_text else ""
+    # maxsplit stops after the fifth word - that's all the check needs to know
+    if anchor_text and len(anchor_text.split(maxsplit=4)) > 4:
         toxicity_score += TOXICITY_WEIGHTS['keyword_stuffing']
         reasons.append("Unusually long anchor text (potential keyword stuffing)")
     
-    if anchor_text and any(indicator in anchor_text.lower() for indicator in SPAM_INDICATORS):
+    if anchor_text and SPAM_INDICATOR_PATTERN.search(anchor_lower):
         toxicity_score += TOXICITY_WEIGHTS['spam_keywords']
         reasons.append("Spam keyword detected in anchor text")
     
     # Check 5: Page type analysis
-    if page_type in ["comment", "forum", "blog_spam"]:
+    if page_type in RISKY_PAGE_TYPES:
         toxicity_score += TOXICITY_WEIGHTS['risky_page_type']
         reasons.append(f"Risky page type: {page_type} (often associated with spam)")
     
     # Check 6: Generic/manipulative anchor text
-    if anchor_text and anchor_text.lower() in GENERIC_ANCHORS:
+    if anchor_text and anchor_lower in GENERIC_ANCHORS_SET:
         toxicity_score += TOXICITY_WEIGHTS['generic_anchor']
         reasons.append("Generic anchor text (natural links typically have descriptive anchors)")
     
@@ -467,10 +957,11 @@ def extract_page_backlinks(url: str):
     """
     try:
         headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = fetch_page(url, headers)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # None for an empty body, which simply yields no links
+        root = parse_page(url, response)
         
         # Extract all links
         backlinks = []
@@ -485,24 +976,30 @@ def extract_page_backlinks(url: str):
         }
         
         # Parse the page domain to identify internal vs external links
-        from urllib.parse import urlparse
         page_domain = urlparse(url).netloc.replace('www.', '')
+        has_sponsored = False
+        has_ugc = False
         
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '').strip()
+        for link in (root.iter('a') if root is not None else ()):
+            href = link.get('href')
+            if href is None:
+                continue
+            href = href.strip()
             
             # Skip empty hrefs, anchors, and javascript
-            if not href or href.startswith('javascript:') or href.startswith('mailto:'):
+            if not href or href.startswith(('javascript:', 'mailto:')):
                 continue
             
             # Get anchor text
-            anchor_text = link.get_text(strip=True)
+            anchor_text = ''.join(text.strip() for text in link.itertext())
             
             # Check if link has rel attribute (nofollow, sponsored, ugc)
-            rel = link.get('rel', [])
+            rel = link.get('rel', '').split()
             is_nofollow = 'nofollow' in rel
             is_sponsored = 'sponsored' in rel
             is_ugc = 'ugc' in rel
+            has_sponsored = has_sponsored or is_sponsored
+            has_ugc = has_ugc or is_ugc
             
             # Determine if internal or external
             if href.startswith('/'):
@@ -511,7 +1008,7 @@ def extract_page_backlinks(url: str):
                 link_stats["internal_links"] += 1
             elif href.startswith('http'):
                 link_type = "external"
-                target_domain = urlparse(href).netloc.replace('www.', '')
+                target_domain = url_netloc(href).replace('www.', '')
                 link_stats["external_links"] += 1
             else:
                 # Relative URLs
@@ -596,8 +1093,8 @@ def extract_page_backlinks(url: str):
                 "dofollow_quality": f"{link_stats['dofollow_percent']}% of links pass link equity",
                 "anchor_text_coverage": f"{link_stats['links_with_anchor']}/{link_stats['total_links']} links have anchor text",
                 "has_nofollow_links": link_stats["nofollow_links"] > 0,
-                "has_sponsored_links": any(l["is_sponsored"] for l in backlinks),
-                "has_ugc_links": any(l["is_ugc"] for l in backlinks)
+                "has_sponsored_links": has_sponsored,
+                "has_ugc_links": has_ugc
             }
         }
         
@@ -609,20 +1106,14 @@ def extract_page_backlinks(url: str):
         }
 
 # --- 1. Technical Scraper ---
+@cache_results
 def extract_meta_tags(url: str):
     """
     Scrapes a URL to extract SEO-relevant meta tags (Title, Description, H1-H3).
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        headers = BROWSER_HEADERS
+        response = fetch_page(url, headers)
         
         if response.status_code == 403:
             return {
@@ -634,21 +1125,37 @@ def extract_meta_tags(url: str):
         
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # None for an empty body, which leaves the defaults below in place
+        root = parse_page(url, response)
         
         data = {
             "url": url,
-            "title": soup.title.string if soup.title else "No Title Found",
+            "title": "No Title Found",
             "meta_description": "No Description Found",
-            "h1": [h.get_text(strip=True) for h in soup.find_all('h1')],
-            "h2": [h.get_text(strip=True) for h in soup.find_all('h2')],
-            "images_missing_alt": len([img for img in soup.find_all('img') if not img.get('alt')])
+            "h1": [],
+            "h2": [],
+            "images_missing_alt": 0
         }
-
-        # Safe extraction of meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            data["meta_description"] = meta_desc.get('content', "No Description Found")
+        
+        # Collect everything in a single walk over the tree
+        title_found = meta_desc_found = False
+        for tag in (root.iter(*META_TAGS) if root is not None else ()):
+            name = tag.tag
+            if name == 'h1':
+                data["h1"].append(''.join(text.strip() for text in tag.itertext()))
+            elif name == 'h2':
+                data["h2"].append(''.join(text.strip() for text in tag.itertext()))
+            elif name == 'img':
+                if not tag.get('alt'):
+                    data["images_missing_alt"] += 1
+            elif name == 'title':
+                if not title_found:
+                    data["title"] = tag.text
+                    title_found = True
+            elif not meta_desc_found and tag.get('name') == 'description':
+                # Safe extraction of meta description
+                data["meta_description"] = tag.get('content', "No Description Found")
+                meta_desc_found = True
             
         return data
     except requests.exceptions.Timeout:
@@ -672,52 +1179,87 @@ def extract_meta_tags(url: str):
 
 
 # --- 2. Broken Link Checker (Lightweight) ---
+# Long-lived pool for HEAD probes, so checks don't spin up fresh threads on every call
+LINK_CHECK_EXECUTOR = ThreadPoolExecutor(max_workers=BROKEN_LINK_CHECKER_WORKERS)
+
+
+def probe_link(link: str):
+    """
+    Sends a HEAD request to a link and reports whether it is broken.
+    """
+    try:
+        r = PROBE_SESSION.head(link, timeout=HEAD_REQUEST_TIMEOUT)
+        status = "Broken" if r.status_code >= 400 else "OK"
+        return {"link": link, "status": status, "code": r.status_code}
+    except:
+        return {"link": link, "status": "Error", "code": 0}
+
+
 def check_broken_links(url: str, limit: int = None):
     """
     Finds links on the page and checks their status code. 
     Limited to BROKEN_LINK_CHECKER_LIMIT to prevent long wait times during demos.
     """
-    from data_config import BROKEN_LINK_CHECKER_LIMIT
     if limit is None:
         limit = BROKEN_LINK_CHECKER_LIMIT
     
     try:
         headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        links = [a.get('href') for a in soup.find_all('a', href=True) if a.get('href').startswith('http')]
-        unique_links = list(set(links))[:limit]
+        response = fetch_page(url, headers)
+        root = parse_page(url, response)
+        
+        # Dedupe in page order and stop as soon as we have enough links. The fragment
+        # is never sent to the server, so page#top and page share one HEAD check.
+        seen = {}
+        for a in (root.iter('a') if root is not None else ()):
+            if len(seen) >= limit:
+                break
+            href = a.get('href')
+            if href is None:
+                continue
+            href = href.split('#', 1)[0]
+            if href.startswith(('http://', 'https://')):
+                seen[href] = None
+        unique_links = list(seen)
         
-        results = []
-        for link in unique_links:
-            try:
-                r = requests.head(link, headers=headers, timeout=HEAD_REQUEST_TIMEOUT)
-                status = "Broken" if r.status_code >= 400 else "OK"
-                results.append({"link": link, "status": status, "code": r.status_code})
-            except:
-                results.append({"link": link, "status": "Error", "code": 0})
+        # HEAD checks are I/O-bound, so run them concurrently (results keep link order)
+        results = list(LINK_CHECK_EXECUTOR.map(probe_link, unique_links))
                 
         return {"checked_count": len(results), "details": results}
     except Exception as e:
         return {"error": str(e)}
 
 # --- 3. Performance Estimator ---
+@cache_results
 def get_page_speed(url: str):
     """
     Estimates page load performance based on server response time and content size.
     Note: For production, integrate Google PageSpeed Insights API.
     """
-    from data_config import SPEED_GOOD_THRESHOLD, SPEED_WARNING_THRESHOLD, PAGE_SIZE_WARNING
     
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        end_time = time.time()
+        size_truncated = False
+        with PROBE_SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            content_length = response.headers.get('Content-Length', '')
+            if content_length.isdigit() and response.headers.get('Content-Encoding', 'identity') == 'identity':
+                # An uncompressed body's declared length is its size; read just the
+                # first chunk so the timing still covers the start of the body
+                size_bytes = int(content_length)
+                next(response.iter_content(chunk_size=8192), None)
+            else:
+                # Stream the body and only count bytes, giving up once the page is past the cap
+                size_bytes = 0
+                for chunk in response.iter_content(chunk_size=8192):
+                    size_bytes += len(chunk)
+                    if size_bytes > PAGE_SIZE_READ_CAP:
+                        size_truncated = True
+                        break
+        end_time = time.perf_counter()
         
         duration = round((end_time - start_time) * 1000, 2)  # ms
-        size_kb = round(len(response.content) / 1024, 2)
+        size_kb = round(size_bytes / 1024, 2)
         
         score = 100
         if duration > SPEED_WARNING_THRESHOLD:
@@ -730,6 +1272,7 @@ def get_page_speed(url: str):
         return {
             "load_time_ms": duration,
             "page_size_kb": size_kb,
+            "page_size_truncated": size_truncated,
             "estimated_score": max(0, score),
             "status": "Good" if duration < SPEED_GOOD_THRESHOLD else "Needs Improvement"
         }
@@ -742,59 +1285,153 @@ def analyze_keyword_density(text: str = "", url: str = None):
     Analyzes keyword frequency on a page, filtering out common stopwords and non-meaningful terms.
     Uses STOPWORDS_SET from data_config.py for comprehensive stopword filtering.
     """
-    content = text
     if url:
-        try:
-            headers = {'User-Agent': DEFAULT_USER_AGENT}
-            response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            # Remove scripts and styles
-            for script in soup(["script", "style"]):
-                script.extract()
-            content = soup.get_text()
-        except Exception as e:
-            return {"error": str(e)}
-    
-    # Tokenization: extract words
-    words = re.findall(r'\w+', content.lower())
-    
-    # Filter: remove stopwords and short words (less than MIN_KEYWORD_LENGTH chars)
-    # Only keep meaningful content words
-    filtered_words = [
-        w for w in words 
-        if w not in STOPWORDS_SET and len(w) >= MIN_KEYWORD_LENGTH and not w.isdigit()
-    ]
+        return analyze_page_keyword_density(url)
+    # Pasted text is counted fresh each time rather than kept in a cache keyed on the whole text
+    return keyword_density_report(text)
+
+
+@cache_results
+def analyze_page_keyword_density(url: str):
+    """
+    Fetches a page and analyzes the keyword frequency of its visible text.
+    Results are cached per URL.
+    """
+    try:
+        headers = {'User-Agent': DEFAULT_USER_AGENT}
+        response = fetch_page(url, headers)
+        # The tree is shared with the other tools, so select the visible text
+        # rather than stripping scripts and styles out of it
+        root = parse_page(url, response)
+        texts = VISIBLE_TEXT_XPATH(root) if root is not None else ()
+        # Separator keeps words from adjacent tags from running together
+        content = ' '.join(filter(None, (text.strip() for text in texts)))
+    except Exception as e:
+        return {"error": str(e)}
+    return keyword_density_report(content)
+
+
+def keyword_density_report(content: str):
+    """
+    Counts the meaningful words in content and reports the most frequent ones.
+    """
+    # Tokenization: extract words and count them all in one C-level Counter pass
+    content = content.lower()
+    word_pattern = ASCII_WORD_PATTERN if content.isascii() else WORD_PATTERN
+    counter = Counter(word_pattern.findall(content))
     
-    counter = Counter(filtered_words)
+    # Filter: remove stopwords and numbers (short words never reach here, see WORD_PATTERN)
+    # Only keep meaningful content words. Filtering the counted vocabulary in place
+    # means each check runs once per distinct word, however long the page.
+    for w in STOPWORDS_SET.intersection(counter):
+        del counter[w]
+    for w in [w for w in counter if w.isdigit()]:
+        del counter[w]
     top_keywords = counter.most_common(TOP_KEYWORDS_COUNT)
     
     return {
         "top_keywords": [{"word": w, "count": c} for w, c in top_keywords],
-        "total_words": len(filtered_words),
+        "total_words": counter.total(),
         "filter_type": "Intelligent Stopword Filtering",
         "filter_description": "Excludes common English stopwords, pronouns, auxiliaries, and short words"
     }
 
 # --- 5. SERP Spy (Competitor Analysis) ---
+# One DuckDuckGo client (and its HTTP session) shared by every search
+DDGS_CLIENT = None
+DDGS_CLIENT_LOCK = threading.Lock()
+
+# Recent search results keyed by keyword
+SERP_CACHE = TTLCache(maxsize=SERP_CACHE_MAX_ENTRIES, ttl=SERP_CACHE_TTL)
+
+# Paces searches that miss the cache, so batch lookups don't get us rate limited
+SERP_RATE_LIMITER = TokenBucket(rate=SERP_RATE_LIMIT, capacity=SERP_RATE_BURST)
+
+# Batch lookups wait on the rate limiter, so they get their own small pool
+# rather than tying up TOOL_EXECUTOR workers that audits need
+SERP_EXECUTOR = ThreadPoolExecutor(max_workers=SERP_BATCH_WORKERS)
+
+
+def serp_cache_key(keyword: str) -> str:
+    """
+    Normalizes a keyword for SERP_CACHE. Searches ignore case and spacing,
+    so "SEO Tools" and "seo  tools" share an entry.
+    """
+    return ' '.join(keyword.lower().split())
+
+
+def get_ddgs_client():
+    """
+    Returns the shared DuckDuckGo client, creating it on first use.
+    """
+    global DDGS_CLIENT
+    if DDGS_CLIENT is None:
+        # Batch lookups call this from several threads; only one may build the client
+        with DDGS_CLIENT_LOCK:
+            if DDGS_CLIENT is None:
+                # Imported here so loading the other tools doesn't pay for the search client
+                from duckduckgo_search import DDGS
+                DDGS_CLIENT = DDGS()
+    return DDGS_CLIENT
+
+
 def get_competitor_rankings(keyword: str):
     """
     Uses DuckDuckGo to find who is ranking for a specific keyword.
     """
     try:
-        results = DDGS().text(keyword, max_results=5)
+        cache_key = serp_cache_key(keyword)
+        results = SERP_CACHE.get(cache_key)
+        if results is None:
+            SERP_RATE_LIMITER.acquire()
+            results = get_ddgs_client().text(keyword, max_results=5)
+            SERP_CACHE.set(cache_key, results)
         return {"keyword": keyword, "competitors": results}
     except Exception as e:
         return {"error": str(e)}
 
+
+def get_competitor_rankings_batch(keywords: list):
+    """
+    Looks up rankings for several keywords at once on the SERP worker pool.
+    Keywords that differ only in case or spacing are searched once. Returns
+    results in input order, each labelled with the keyword as given.
+    """
+    first_keywords = {}
+    for keyword in keywords:
+        first_keywords.setdefault(serp_cache_key(keyword), keyword)
+    results = dict(zip(first_keywords, SERP_EXECUTOR.map(get_competitor_rankings, first_keywords.values())))
+    
+    batch_results = []
+    for keyword in keywords:
+        result = results[serp_cache_key(keyword)]
+        batch_results.append({**result, "keyword": keyword} if "keyword" in result else result)
+    return batch_results
+
+# --- Combined Page Audit ---
+def audit_page(url: str):
+    """
+    Runs the meta, speed, broken link and keyword tools on one URL together.
+    The HTML tools share a single download through fetch_page; the speed
+    check keeps its own request so its timing reflects a real load.
+    """
+    return run_tools_concurrently({
+        "meta_tags": (extract_meta_tags, (url,)),
+        "page_speed": (get_page_speed, (url,)),
+        "broken_links": (check_broken_links, (url, 5)),
+        "keyword_density": (analyze_keyword_density, ("", url))
+    })
+
+
 # --- 6. Backlink Analyzer ---
-def calculate_intelligent_link_velocity(total_backlinks: int, high_auth_count: int, medium_auth_count: int, low_auth_count: int):
+def calculate_intelligent_link_velocity(total_backlinks: int, high_auth_count: int, medium_auth_count: int, low_auth_count: int, seed=None):
     """
     Calculates intelligent link velocity metrics using authority-weighted analysis.
     Returns realistic velocity data based on link distribution and quality.
     Uses AUTHORITY_WEIGHTS and thresholds from data_config.py
+    Passing a seed makes the growth figures reproducible.
     """
-    import random
-    from datetime import datetime, timedelta
+    rng = random if seed is None else random.Random(seed)
     
     # Base velocity calculation using weighted authority distribution
     weighted_total = (
@@ -805,7 +1442,7 @@ def calculate_intelligent_link_velocity(total_backlinks: int, high_auth_count: i
     
     # Calculate realistic 30-day and 90-day new links
     # Assuming sustainable growth rate from LINK_VELOCITY_MIN_GROWTH to LINK_VELOCITY_MAX_GROWTH per month
-    monthly_growth_rate = random.uniform(LINK_VELOCITY_MIN_GROWTH, LINK_VELOCITY_MAX_GROWTH)
+    monthly_growth_rate = rng.uniform(LINK_VELOCITY_MIN_GROWTH, LINK_VELOCITY_MAX_GROWTH)
     new_links_30_days = int(weighted_total * monthly_growth_rate)
     new_links_90_days = int(weighted_total * (monthly_growth_rate * 2.5))
     
@@ -815,7 +1452,7 @@ def calculate_intelligent_link_velocity(total_backlinks: int, high_auth_count: i
     
     # Calculate month-over-month acceleration
     # Last 30 days vs previous 30 days (assumed)
-    previous_30_days = max(1, int(new_links_30_days * random.uniform(0.6, 1.2)))
+    previous_30_days = max(1, int(new_links_30_days * rng.uniform(0.6, 1.2)))
     acceleration = ((new_links_30_days - previous_30_days) / previous_30_days) * 100 if previous_30_days > 0 else 0
     
     # Determine trend based on acceleration and growth pattern using thresholds from config
@@ -877,12 +1514,20 @@ def analyze_backlinks(url: str):
     """
     Analyzes backlinks to a domain using free APIs and heuristics.
     Returns comprehensive link profile data, quality metrics, and competitor analysis.
+    The simulated data is seeded from the domain, so a domain always gets the same profile.
     """
     try:
         # Extract domain from URL
-        from urllib.parse import urlparse
         domain = urlparse(url).netloc.replace('www.', '')
         
+        # A URL without a scheme (or a bare word) has no usable domain; stop before simulating a profile for it
+        if not domain or '.' not in domain:
+            return {
+                "error": "Invalid URL",
+                "domain": url,
+                "message": f"Could not find a domain in {url!r}. Please enter a full URL such as https://example.com."
+            }
+        
         # Collect backlink data using multiple methods
         backlinks_data = {
             "domain": domain,
@@ -912,11 +1557,13 @@ def analyze_backlinks(url: str):
         # Simulate backlink discovery (in production, use Ahrefs/SEMrush API)
         # Using heuristics and searches to estimate link profile
         
-        # Generate realistic backlink simulation
-        import random
-        total_backlinks = random.randint(50, 500)
-        referring_domains = random.randint(20, 150)
-        dofollow_percent = random.randint(60, 85)
+        # Generate realistic backlink simulation. hash() is salted per process, so the
+        # seed comes from blake2b to stay stable across workers and restarts.
+        seed = int.from_bytes(hashlib.blake2b(domain.lower().encode(), digest_size=8).digest(), 'big')
+        rng = random.Random(seed)
+        total_backlinks = rng.randint(50, 500)
+        referring_domains = rng.randint(20, 150)
+        dofollow_percent = rng.randint(60, 85)
         
         backlinks_data["total_backlinks"] = total_backlinks
         backlinks_data["referring_domains"] = referring_domains
@@ -928,61 +1575,95 @@ def analyze_backlinks(url: str):
         medium_auth_count = int(referring_domains * 0.35)  # 35% medium authority
         low_auth_count = referring_domains - high_auth_count - medium_auth_count
         
-        # Generate realistic domains for each authority level
-        high_auth_domains = generate_realistic_websites(high_auth_count)
-        medium_auth_domains = generate_realistic_websites(medium_auth_count)
-        low_auth_domains = generate_realistic_websites(low_auth_count)
+        # Generate realistic domains for every tier in one batch, then split it by authority level
+        source_domains = generate_realistic_websites(referring_domains, rng=rng)
+        high_auth_domains = source_domains[:high_auth_count]
+        medium_auth_domains = source_domains[high_auth_count:high_auth_count + medium_auth_count]
+        low_auth_domains = source_domains[high_auth_count + medium_auth_count:]
         
+        # Each attribute is drawn for a whole authority tier in one rng.choices call
         # High Authority Links (DA > 60)
-        for i, domain_name in enumerate(high_auth_domains):
-            backlinks_data["link_profile"]["high_authority_links"].append({
+        backlinks_data["link_profile"]["high_authority_links"] = [
+            {
                 "source_domain": domain_name,
-                "domain_authority": random.randint(DOMAIN_AUTHORITY_HIGH, 95),
-                "anchor_text": random.choice(QUALITY_ANCHOR_KEYWORDS),
+                "domain_authority": domain_authority,
+                "anchor_text": anchor_text,
                 "link_type": "dofollow",
-                "page_type": random.choice(["homepage", "resource", "article"])
-            })
+                "page_type": page_type
+            }
+            for domain_name, domain_authority, anchor_text, page_type in zip(
+                high_auth_domains,
+                rng.choices(range(DOMAIN_AUTHORITY_HIGH, 96), k=high_auth_count),
+                rng.choices(QUALITY_ANCHOR_KEYWORDS, k=high_auth_count),
+                rng.choices(HIGH_AUTHORITY_PAGE_TYPES, k=high_auth_count)
+            )
+        ]
         
         # Medium Authority Links (DA 30-60)
-        for i, domain_name in enumerate(medium_auth_domains):
-            backlinks_data["link_profile"]["medium_authority_links"].append({
+        backlinks_data["link_profile"]["medium_authority_links"] = [
+            {
                 "source_domain": domain_name,
-                "domain_authority": random.randint(DOMAIN_AUTHORITY_MEDIUM_MIN, DOMAIN_AUTHORITY_MEDIUM_MAX),
-                "anchor_text": random.choice(QUALITY_ANCHOR_KEYWORDS[:8]),
-                "link_type": random.choice(["dofollow", "nofollow"]),
-                "page_type": random.choice(["article", "directory", "resource"])
-            })
+                "domain_authority": domain_authority,
+                "anchor_text": anchor_text,
+                "link_type": link_type,
+                "page_type": page_type
+            }
+            for domain_name, domain_authority, anchor_text, link_type, page_type in zip(
+                medium_auth_domains,
+                rng.choices(range(DOMAIN_AUTHORITY_MEDIUM_MIN, DOMAIN_AUTHORITY_MEDIUM_MAX + 1), k=medium_auth_count),
+                rng.choices(MEDIUM_AUTHORITY_ANCHORS, k=medium_auth_count),
+                rng.choices(MEDIUM_AUTHORITY_LINK_TYPES, k=medium_auth_count),
+                rng.choices(MEDIUM_AUTHORITY_PAGE_TYPES, k=medium_auth_count)
+            )
+        ]
         
         # Low Authority Links (DA < 30)
-        for i, domain_name in enumerate(low_auth_domains):
-            backlinks_data["link_profile"]["low_authority_links"].append({
+        backlinks_data["link_profile"]["low_authority_links"] = [
+            {
                 "source_domain": domain_name,
-                "domain_authority": random.randint(1, DOMAIN_AUTHORITY_LOW_MAX),
-                "anchor_text": random.choice(GENERIC_ANCHORS),
-                "link_type": random.choice(["dofollow", "nofollow", "sponsored"]),
-                "page_type": random.choice(["blog", "forum", "comment"])
-            })
-        
-        # Anchor Text Analysis
-        anchor_texts = []
-        for link in backlinks_data["link_profile"]["high_authority_links"]:
-            anchor_texts.append(link["anchor_text"])
-        for link in backlinks_data["link_profile"]["medium_authority_links"]:
-            anchor_texts.append(link["anchor_text"])
+                "domain_authority": domain_authority,
+                "anchor_text": anchor_text,
+                "link_type": link_type,
+                "page_type": page_type
+            }
+            for domain_name, domain_authority, anchor_text, link_type, page_type in zip(
+                low_auth_domains,
+                rng.choices(range(1, DOMAIN_AUTHORITY_LOW_MAX + 1), k=low_auth_count),
+                rng.choices(GENERIC_ANCHORS, k=low_auth_count),
+                rng.choices(LOW_AUTHORITY_LINK_TYPES, k=low_auth_count),
+                rng.choices(LOW_AUTHORITY_PAGE_TYPES, k=low_auth_count)
+            )
+        ]
+        
+        # Anchor Text Analysis (Counter consumes the anchors straight from the link dicts)
+        anchor_counter = Counter(chain(
+            (link["anchor_text"] for link in backlinks_data["link_profile"]["high_authority_links"]),
+            (link["anchor_text"] for link in backlinks_data["link_profile"]["medium_authority_links"])
+        ))
+        
+        # Classify each distinct anchor once, weighted by how often it was used
+        brand = domain.split('.')[0].lower()
+        branded_anchors = keyword_anchors = generic_anchors = 0
+        for text, count in anchor_counter.items():
+            if brand in text.lower():
+                branded_anchors += count
+            if len(text) > 3 and text not in ANCHOR_ANALYSIS_NON_KEYWORD:
+                keyword_anchors += count
+            if text in ANCHOR_ANALYSIS_GENERIC:
+                generic_anchors += count
         
-        anchor_counter = Counter(anchor_texts)
         backlinks_data["anchor_text_analysis"] = {
             "most_common": [{"text": text, "count": count} for text, count in anchor_counter.most_common(5)],
-            "branded_anchors": sum(1 for text in anchor_texts if domain.split('.')[0].lower() in text.lower()),
-            "keyword_anchors": sum(1 for text in anchor_texts if len(text) > 3 and text not in ["click here", "read more"]),
-            "generic_anchors": sum(1 for text in anchor_texts if text in ["click here", "read more", "check this out", "learn more"])
+            "branded_anchors": branded_anchors,
+            "keyword_anchors": keyword_anchors,
+            "generic_anchors": generic_anchors
         }
         
-        # Link Type Analysis using LINK_TYPE_DISTRIBUTION from config
-        backlinks_data["link_types"]["homepage"] = int(referring_domains * LINK_TYPE_DISTRIBUTION['homepage'])
-        backlinks_data["link_types"]["inner_pages"] = int(referring_domains * LINK_TYPE_DISTRIBUTION['inner_pages'])
-        backlinks_data["link_types"]["resource_links"] = int(referring_domains * LINK_TYPE_DISTRIBUTION['resource_links'])
-        backlinks_data["link_types"]["blog_links"] = int(referring_domains * LINK_TYPE_DISTRIBUTION['blog_links'])
+        # Link Type Analysis using LINK_TYPE_DISTRIBUTION from config (its keys are the link types)
+        backlinks_data["link_types"] = {
+            link_type: int(referring_domains * share)
+            for link_type, share in LINK_TYPE_DISTRIBUTION.items()
+        }
         
         # Calculate link quality score (0-100)
         quality_score = 50  # Base score
@@ -992,10 +1673,10 @@ def analyze_backlinks(url: str):
         backlinks_data["link_quality_score"] = min(100, int(quality_score))
         
         # Identify potentially toxic links using real detection logic
-        # Analyze all links for toxic characteristics
-        all_links = (
-            backlinks_data["link_profile"]["high_authority_links"] +
-            backlinks_data["link_profile"]["medium_authority_links"] +
+        # Analyze all links for toxic characteristics (chained, not concatenated)
+        all_links = chain(
+            backlinks_data["link_profile"]["high_authority_links"],
+            backlinks_data["link_profile"]["medium_authority_links"],
             backlinks_data["link_profile"]["low_authority_links"]
         )
         
@@ -1021,18 +1702,6 @@ def analyze_backlinks(url: str):
         
         # METHOD 1: Extract competitor domains from backlink sources
         # Competitors are often linked from the same authority sources as you
-        from data_config import (
-            COMPETITORS_TO_ANALYZE,
-            COMPETITOR_CONFIDENCE_HIGH,
-            COMPETITOR_CONFIDENCE_MEDIUM,
-            COMPETITOR_CONFIDENCE_LOW,
-            AUTHORITY_GAP_HIGH_IMPACT,
-            AUTHORITY_GAP_MEDIUM_IMPACT,
-            DOMAIN_DIVERSITY_HIGH_IMPACT,
-            DOMAIN_DIVERSITY_MEDIUM_IMPACT,
-            DOFOLLOW_QUALITY_GAP_IMPACT
-        )
-        
         high_auth_sources = [link["source_domain"] for link in backlinks_data["link_profile"]["high_authority_links"]]
         
         # Simulate that high-authority domains link to 2-3 competitors as well
@@ -1045,17 +1714,19 @@ def analyze_backlinks(url: str):
         
         # Detect competitors based on common linking sources
         detected_competitors = []
+        seen_competitor_domains = set()
         for source in high_auth_sources[::max(1, len(high_auth_sources) // 3)]:  # Sample every nth source
             # Simulate that this authority source links to competitors
-            num_competitors_per_source = random.randint(1, 3)
+            num_competitors_per_source = rng.randint(1, 3)
             for j in range(num_competitors_per_source):
                 comp_domain = f"[DEMO] competitor{len(detected_competitors) + 1}.com"
-                if comp_domain not in [c["domain"] for c in detected_competitors]:
+                if comp_domain not in seen_competitor_domains:
+                    seen_competitor_domains.add(comp_domain)
                     detected_competitors.append({
                         "domain": comp_domain,
                         "detected_from": source,
                         "authority_level": "High-authority",
-                        "detection_confidence": round(random.uniform(COMPETITOR_CONFIDENCE_MEDIUM, COMPETITOR_CONFIDENCE_HIGH), 2),
+                        "detection_confidence": round(rng.uniform(COMPETITOR_CONFIDENCE_MEDIUM, COMPETITOR_CONFIDENCE_HIGH), 2),
                         "is_simulated": True
                     })
         
@@ -1073,12 +1744,17 @@ def analyze_backlinks(url: str):
         # METHOD 2: Build competitor profiles by analyzing common backlink patterns
         backlinks_data["opportunities"] = []
         
+        # The user's side of every gap comparison is the same for each competitor
+        user_dofollow = backlinks_data["dofollow_links"]
+        user_dofollow_ratio = (user_dofollow / total_backlinks * 100) if total_backlinks > 0 else 0
+        user_ratio_text = f"{user_dofollow_ratio:.0f}%"
+        
         for competitor in detected_competitors[:COMPETITORS_TO_ANALYZE]:  # Analyze top N competitors
             # Simulate realistic competitor backlink profiles relative to user's profile
-            comp_total_backlinks = total_backlinks + random.randint(-100, 300)
-            comp_referring_domains = referring_domains + random.randint(-30, 100)
-            comp_high_auth_links = high_auth_count + random.randint(-5, 20)
-            comp_dofollow_percent = random.randint(65, 85)
+            comp_total_backlinks = total_backlinks + rng.randint(-100, 300)
+            comp_referring_domains = referring_domains + rng.randint(-30, 100)
+            comp_high_auth_links = high_auth_count + rng.randint(-5, 20)
+            comp_dofollow_percent = rng.randint(65, 85)
             comp_dofollow_links = int(comp_total_backlinks * (comp_dofollow_percent / 100))
             
             # Authority Gap Analysis
@@ -1113,33 +1789,31 @@ def analyze_backlinks(url: str):
             
             # Dofollow Link Quality Gap
             comp_dofollow_ratio = (comp_dofollow_links / max(1, comp_total_backlinks) * 100) if comp_total_backlinks > 0 else 0
-            user_dofollow_ratio = (backlinks_data["dofollow_links"] / total_backlinks * 100) if total_backlinks > 0 else 0
             
             if comp_dofollow_ratio > user_dofollow_ratio + DOFOLLOW_QUALITY_GAP_IMPACT:
+                comp_ratio_text = f"{comp_dofollow_ratio:.0f}%"
                 backlinks_data["opportunities"].append({
                     "type": "competitor_gap",
                     "is_simulated": True,
                     "title": f"[DEMO] Link Quality Gap vs {competitor['domain']}",
-                    "description": f"{competitor['domain']} has a {comp_dofollow_ratio:.0f}% dofollow ratio vs your {user_dofollow_ratio:.0f}%. Higher quality link acquisition strategy.",
+                    "description": f"{competitor['domain']} has a {comp_ratio_text} dofollow ratio vs your {user_ratio_text}. Higher quality link acquisition strategy.",
                     "competitor": competitor["domain"],
                     "detection_confidence": competitor["detection_confidence"],
-                    "gap_metric": f"{comp_dofollow_ratio:.0f}% vs {user_dofollow_ratio:.0f}% dofollow",
+                    "gap_metric": f"{comp_ratio_text} vs {user_ratio_text} dofollow",
                     "estimated_impact": "Medium",
                     "action": "Focus on dofollow link placements. Seek paid content and resource page links that pass link equity.",
-                    "potential_links": int(comp_dofollow_links - backlinks_data["dofollow_links"])
+                    "potential_links": int(comp_dofollow_links - user_dofollow)
                 })
         
         # Link velocity (estimated new links per month)
         # Calculate intelligent link velocity based on link distribution
-        high_auth_count = len(backlinks_data["link_profile"]["high_authority_links"])
-        medium_auth_count = len(backlinks_data["link_profile"]["medium_authority_links"])
-        low_auth_count = len(backlinks_data["link_profile"]["low_authority_links"])
-        
+        # (the tier counts above are exactly the sizes of the generated tiers)
         backlinks_data["link_velocity"] = calculate_intelligent_link_velocity(
             total_backlinks=backlinks_data["total_backlinks"],
             high_auth_count=high_auth_count,
             medium_auth_count=medium_auth_count,
-            low_auth_count=low_auth_count
+            low_auth_count=low_auth_count,
+            seed=rng.getrandbits(64)
         )
         
         return backlinks_data
@@ -1178,7 +1852,7 @@ def get_core_web_vitals(url: str, strategy: str = "desktop"):
         }
         
         headers = {'User-Agent': DEFAULT_USER_AGENT}
-        response = requests.get(api_url, params=params, headers=headers, timeout=30)
+        response = SESSION.get(api_url, params=params, headers=headers, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -1427,6 +2101,3 @@ def analyze_cwv_improvements(cwv_data: dict) -> dict:
         "warnings": warnings,
         "strategy": cwv_data.get("strategy", "unknown")
     }
-
-
-import os
\ No newline at end of file